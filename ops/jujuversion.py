@@ -17,8 +17,8 @@
 import os
 import re
 import warnings
-from functools import total_ordering
-from typing import Union
+from functools import lru_cache, total_ordering
+from typing import Tuple, Union
 
 
 @total_ordering
@@ -32,25 +32,34 @@ class JujuVersion:
     """
 
     _pattern_re = re.compile(
-        r"""^
+        r"""
     (?P<major>\d{1,9})\.(?P<minor>\d{1,9})       # <major> and <minor> numbers are always there
     ((?:\.|-(?P<tag>[a-z]+))(?P<patch>\d{1,9}))? # sometimes with .<patch> or -<tag><patch>
-    (\.(?P<build>\d{1,9}))?$                     # and sometimes with a <build> number.
+    (\.(?P<build>\d{1,9}))?                      # and sometimes with a <build> number.
     """,
         re.VERBOSE,
     )
 
     def __init__(self, version: str):
-        m = self._pattern_re.match(version)
+        self.major, self.minor, self.tag, self.patch, self.build = self._parse(version)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _parse(version: str) -> Tuple[int, int, str, int, int]:
+        # The same handful of version strings (JUJU_VERSION, and the literals
+        # used in comparisons) are parsed over and over, so cache the result.
+        m = JujuVersion._pattern_re.fullmatch(version)
         if not m:
             raise RuntimeError(f'"{version}" is not a valid Juju version string')
 
         d = m.groupdict()
-        self.major = int(m.group('major'))
-        self.minor = int(m.group('minor'))
-        self.tag = d['tag'] or ''
-        self.patch = int(d['patch'] or 0)
-        self.build = int(d['build'] or 0)
+        return (
+            int(m.group('major')),
+            int(m.group('minor')),
+            d['tag'] or '',
+            int(d['patch'] or 0),
+            int(d['build'] or 0),
+        )
 
     def __repr__(self):
         if self.tag:
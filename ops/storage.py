@@ -23,7 +23,7 @@ import stat
 import subprocess
 from datetime import timedelta
 from pathlib import Path
-from typing import Any, Callable, Generator, List, Optional, Tuple, Union, cast
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union, cast
 
 import yaml
 
@@ -226,6 +226,8 @@ class JujuStorage:
 
     def __init__(self, backend: Optional['_JujuStorageBackend'] = None):
         self._backend: _JujuStorageBackend = backend or _JujuStorageBackend()
+        # {key: encoded_value} of writes that haven't been sent to state-set yet.
+        self._pending: Dict[str, str] = {}
 
     def close(self) -> None:
         """Part of the Storage API, close the storage backend.
@@ -236,8 +238,13 @@ class JujuStorage:
     def commit(self) -> None:
         """Part of the Storage API, commit latest changes in the storage backend.
 
-        Nothing to be done for Juju backend, as it's transactional.
+        Writes are buffered until commit, and then sent to Juju in a single
+        state-set call. Juju only persists them once the hook succeeds.
         """
+        if not self._pending:
+            return
+        self._backend.set_encoded(self._pending)
+        self._pending = {}
 
     def save_snapshot(self, handle_path: str, snapshot_data: Any) -> None:
         """Part of the Storage API, persist a snapshot data under the given handle.
@@ -247,7 +254,7 @@ class JujuStorage:
             snapshot_data: The data to be persisted. (as returned by Object.snapshot()). This
                 might be a dict/tuple/int, but must only contain 'simple' python types.
         """
-        self._backend.set(handle_path, snapshot_data)
+        self._pending[handle_path] = self._backend.encode(snapshot_data)
 
     def load_snapshot(self, handle_path: str):
         """Part of the Storage API, retrieve a snapshot that was previously saved.
@@ -259,7 +266,7 @@ class JujuStorage:
             NoSnapshotError: if there is no snapshot for the given handle_path.
         """
         try:
-            content = self._backend.get(handle_path)
+            content = self._get(handle_path)
         except KeyError:
             raise NoSnapshotError(handle_path) from None
         return content
@@ -269,6 +276,7 @@ class JujuStorage:
 
         Dropping a snapshot that doesn't exist is treated as a no-op.
         """
+        self._pending.pop(handle_path, None)
         self._backend.delete(handle_path)
 
     def save_notice(self, event_path: str, observer_path: str, method_name: str):
@@ -306,7 +314,7 @@ class JujuStorage:
             List of (event_path, observer_path, method_name) tuples; empty if no key or is None.
         """
         try:
-            notice_list = self._backend.get(self.NOTICE_KEY)
+            notice_list = self._get(self.NOTICE_KEY)
         except KeyError:
             return []
         if notice_list is None:
@@ -319,7 +327,14 @@ class JujuStorage:
         Args:
             notices: List of (event_path, observer_path, method_name) tuples.
         """
-        self._backend.set(self.NOTICE_KEY, notices)
+        self._pending[self.NOTICE_KEY] = self._backend.encode(notices)
+
+    def _get(self, key: str) -> Any:
+        """Get the value for a key, including writes that have not been committed yet."""
+        encoded_value = self._pending.get(key)
+        if encoded_value is not None:
+            return self._backend.decode(encoded_value)
+        return self._backend.get(key)
 
 
 # we load yaml.CSafeX if available, falling back to slower yaml.SafeX.
@@ -369,6 +384,11 @@ def juju_backend_available() -> bool:
 class _JujuStorageBackend:
     """Implements the interface from the ops library to Juju's state-get/set/etc."""
 
+    def __init__(self):
+        # {key: encoded_value} as last read from or written to Juju; an empty
+        # string means the key is known not to exist.
+        self._cache: Dict[str, str] = {}
+
     def set(self, key: str, value: Any) -> None:
         """Set a key to a given value.
 
@@ -379,15 +399,22 @@ class _JujuStorageBackend:
         Raises:
             CalledProcessError: if 'state-set' returns an error code.
         """
-        # default_flow_style=None means that it can use Block for
-        # complex types (types that have nested types) but use flow
-        # for simple types (like an array). Not all versions of PyYAML
-        # have the same default style.
-        encoded_value = yaml.dump(value, Dumper=_SimpleDumper, default_flow_style=None)
+        self.set_encoded({key: self.encode(value)})
+
+    def set_encoded(self, encoded_values: Dict[str, str]) -> None:
+        """Set several keys at once to values that have already been encoded.
+
+        Args:
+            encoded_values: A mapping of keys to values as returned by encode().
+
+        Raises:
+            CalledProcessError: if 'state-set' returns an error code.
+        """
         content = yaml.dump(
-            {key: encoded_value}, default_style='|', default_flow_style=False, Dumper=_SimpleDumper
+            encoded_values, default_style='|', default_flow_style=False, Dumper=_SimpleDumper
         )
         _run(['state-set', '--file', '-'], input=content, check=True)
+        self._cache.update(encoded_values)
 
     def get(self, key: str) -> Any:
         """Get the bytes value associated with a given key.
@@ -397,11 +424,29 @@ class _JujuStorageBackend:
         Raises:
             CalledProcessError: if 'state-get' returns an error code.
         """
-        # We don't capture stderr here so it can end up in debug logs.
-        p = _run(['state-get', key], stdout=subprocess.PIPE, check=True)
-        if p.stdout == '' or p.stdout == '\n':
+        encoded_value = self._cache.get(key)
+        if encoded_value is None:
+            # We don't capture stderr here so it can end up in debug logs.
+            p = _run(['state-get', key], stdout=subprocess.PIPE, check=True)
+            encoded_value = self._cache[key] = p.stdout
+        if encoded_value == '' or encoded_value == '\n':
             raise KeyError(key)
-        return yaml.load(p.stdout, Loader=_SimpleLoader)  # noqa: S506
+        # Decode on every call so that callers never share a mutable value.
+        return self.decode(encoded_value)
+
+    @staticmethod
+    def encode(value: Any) -> str:
+        """Encode a value in the format used to store it in Juju."""
+        # default_flow_style=None means that it can use Block for
+        # complex types (types that have nested types) but use flow
+        # for simple types (like an array). Not all versions of PyYAML
+        # have the same default style.
+        return yaml.dump(value, Dumper=_SimpleDumper, default_flow_style=None)
+
+    @staticmethod
+    def decode(encoded_value: str) -> Any:
+        """Decode a value previously encoded with encode()."""
+        return yaml.load(encoded_value, Loader=_SimpleLoader)  # noqa: S506
 
     def delete(self, key: str) -> None:
         """Remove a key from being tracked.
@@ -412,6 +457,7 @@ class _JujuStorageBackend:
             CalledProcessError: if 'state-delete' returns an error code.
         """
         _run(['state-delete', key], check=True)
+        self._cache[key] = ''
 
 
 class NoSnapshotError(Exception):
@@ -43,6 +43,17 @@ def test_parsing(vs: str, major: int, minor: int, tag: str, patch: int, build: i
     assert v.build == build
 
 
+def test_parsing_is_cached():
+    ops.JujuVersion._parse.cache_clear()
+    a = ops.JujuVersion('3.4.1')
+    b = ops.JujuVersion('3.4.1')
+    assert ops.JujuVersion._parse.cache_info().hits == 1
+    # Instances are still distinct, so changing one doesn't affect the other.
+    assert a is not b
+    b.patch = 2
+    assert a.patch == 1
+
+
 @unittest.mock.patch('os.environ', new={})
 def test_from_environ():
     # JUJU_VERSION is not set
@@ -140,6 +151,8 @@ def test_supports_pebble_log_forwarding(version: str, has_support: bool):
         '1.21-alpha_dev3',
         # Non-numeric string after the patch number.
         '1.21-alpha123dev3',
+        # Trailing newline.
+        '1.2.3\n',
     ],
 )
 def test_parsing_errors(invalid_version: str):
@@ -387,6 +387,34 @@ class TestJujuStorage(StoragePermutations):
         setup_juju_backend(fake_script, state_file)
         return ops.storage.JujuStorage()
 
+    def test_commit_batches_writes(self, request: pytest.FixtureRequest, fake_script: FakeScript):
+        store = self.create_storage(request, fake_script)
+        store.save_snapshot('foo', {1: 2})
+        store.save_snapshot('bar', {'three': 4})
+        store.save_notice('event', 'observer', 'method')
+        assert store.load_snapshot('foo') == {1: 2}
+        assert ['state-set', '--file', '-'] not in fake_script.calls()
+        store.commit()
+        assert fake_script.calls(clear=True).count(['state-set', '--file', '-']) == 1
+
+        # A fresh storage should see everything written by the single state-set.
+        store = ops.storage.JujuStorage()
+        assert store.load_snapshot('foo') == {1: 2}
+        assert store.load_snapshot('bar') == {'three': 4}
+        assert list(store.notices()) == [('event', 'observer', 'method')]
+
+    def test_drop_uncommitted_snapshot(
+        self,
+        request: pytest.FixtureRequest,
+        fake_script: FakeScript,
+    ):
+        store = self.create_storage(request, fake_script)
+        store.save_snapshot('foo', {1: 2})
+        store.drop_snapshot('foo')
+        store.commit()
+        with pytest.raises(ops.storage.NoSnapshotError):
+            store.load_snapshot('foo')
+
 
 class TestSimpleLoader:
     def test_is_c_loader(self):
@@ -477,6 +505,27 @@ class TestJujuStateBackend:
             ['state-get', 'key'],
         ]
 
+    def test_get_is_cached(self, fake_script: FakeScript):
+        fake_script.write('state-get', 'echo \'foo: "bar"\'')
+        fake_script.write('state-set', 'cat > /dev/null')
+        fake_script.write('state-delete', '')
+        backend = ops.storage._JujuStorageBackend()
+        value = backend.get('key')
+        value['foo'] = 'changed'
+        assert backend.get('key') == {'foo': 'bar'}
+        assert fake_script.calls(clear=True) == [
+            ['state-get', 'key'],
+        ]
+        backend.set('key', {'foo': 'baz'})
+        assert backend.get('key') == {'foo': 'baz'}
+        backend.delete('key')
+        with pytest.raises(KeyError):
+            backend.get('key')
+        assert fake_script.calls(clear=True) == [
+            ['state-set', '--file', '-'],
+            ['state-delete', 'key'],
+        ]
+
     def test_set_and_get_complex_value(self, fake_script: FakeScript):
         t = tempfile.NamedTemporaryFile()  # noqa: SIM115
         try:
@@ -533,7 +582,8 @@ class TestJujuStateBackend:
             "
         """),
         )
-        out = backend.get('Class[foo]/_stored')
+        # Use a fresh backend, so that the value is read back with state-get.
+        out = ops.storage._JujuStorageBackend().get('Class[foo]/_stored')
         assert out == complex_val
 
     # TODO: Add tests for things we don't want to support. eg, YAML that has custom types should
@@ -10,16 +10,19 @@ specific `State` exists in, and the events that can be executed on that `State`.
 
 from __future__ import annotations
 
+import copy
+import dataclasses
 import functools
 import tempfile
-from contextlib import contextmanager
 from pathlib import Path
 from typing import (
     Generic,
     TYPE_CHECKING,
     Any,
     Callable,
+    ClassVar,
     Mapping,
+    TypeVar,
 )
 
 import ops
@@ -61,6 +64,77 @@ logger = scenario_logger.getChild("runtime")
 _DEFAULT_JUJU_VERSION = "3.5"
 
 
+# Used to help people transition from Scenario 6, where events could be strings:
+# {event_name: example `ctx.on` call}
+_EVENT_SUGGESTIONS: dict[str, str] = {
+    **{
+        event: f"{event}()"
+        for event in (
+            "install",
+            "start",
+            "stop",
+            "remove",
+            "update_status",
+            "config_changed",
+            "upgrade_charm",
+            "pre_series_upgrade",
+            "post_series_upgrade",
+            "leader_elected",
+            "collect_app_status",
+            "collect_unit_status",
+        )
+    },
+    **{event: f"{event}(my_secret)" for event in ("secret_changed", "secret_rotate")},
+    **{
+        event: f"{event}(my_secret, revision=1)"
+        for event in ("secret_expired", "secret_remove")
+    },
+    **{
+        event: f"{event}(my_relation)"
+        for event in (
+            "relation_created",
+            "relation_joined",
+            "relation_changed",
+            "relation_departed",
+            "relation_broken",
+        )
+    },
+    **{
+        event: f"{event}(my_storage)"
+        for event in ("storage_attached", "storage_detaching")
+    },
+    "pebble_ready": "pebble_ready(my_container)",
+    "pebble_custom_notice": "pebble_custom_notice(my_container, my_notice)",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_spec(charm_type: type[CharmType]) -> _CharmSpec[CharmType]:
+    """Autoload the charm spec for a charm type, caching the result.
+
+    Loading the spec reads and parses the charm's metadata files from disk,
+    which is wasted work when a test session creates many Contexts for the
+    same charm. Use :func:`_autoload_spec` rather than sharing this spec.
+    """
+    return _CharmSpec.autoload(charm_type)
+
+
+def _autoload_spec(charm_type: type[CharmType]) -> _CharmSpec[CharmType]:
+    """Get a copy of the (cached) autoloaded charm spec for a charm type.
+
+    ``_CharmSpec`` is only shallowly frozen: ``meta``, ``actions``, and ``config``
+    are plain dicts, so each Context gets its own copy of them, and changes made
+    through one Context can't leak into later ones.
+    """
+    spec = _load_spec(charm_type)
+    return dataclasses.replace(
+        spec,
+        meta=copy.deepcopy(spec.meta),
+        actions=copy.deepcopy(spec.actions),
+        config=copy.deepcopy(spec.config),
+    )
+
+
 class Manager(Generic[CharmType]):
     """Context manager to offer test code some runtime charm object introspection.
 
@@ -73,6 +147,8 @@ class Manager(Generic[CharmType]):
             manager.run()
     """
 
+    __slots__ = ("_ctx", "_arg", "_state_in", "_emitted", "_wrapped_ctx", "ops")
+
     def __init__(
         self,
         ctx: Context[CharmType],
@@ -99,12 +175,8 @@ class Manager(Generic[CharmType]):
             )
         return self.ops.charm
 
-    @property
-    def _runner(self):
-        return self._ctx._run  # noqa
-
     def __enter__(self):
-        self._wrapped_ctx = wrapped_ctx = self._runner(self._arg, self._state_in)
+        self._wrapped_ctx = wrapped_ctx = self._ctx._run(self._arg, self._state_in)
         self.ops = wrapped_ctx.__enter__()
         return self
 
@@ -137,16 +209,15 @@ class Manager(Generic[CharmType]):
             self.run()
 
 
-def _copy_doc(original_func: Callable[..., Any]):
-    """Copy the docstring from `original_func` to the wrapped function."""
+_F = TypeVar("_F", bound=Callable[..., Any])
 
-    def decorator(wrapper_func: Callable[..., Any]):
-        @functools.wraps(wrapper_func)
-        def wrapped(*args: Any, **kwargs: Any):
-            return wrapper_func(*args, **kwargs)
 
-        wrapped.__doc__ = original_func.__doc__
-        return wrapped
+def _copy_doc(original_func: Callable[..., Any]):
+    """Copy the docstring from `original_func` to the decorated function."""
+
+    def decorator(func: _F) -> _F:
+        func.__doc__ = original_func.__doc__
+        return func
 
     return decorator
 
@@ -448,7 +519,7 @@ class Context(Generic[CharmType]):
 
     This will be ``None`` if the charm never calls :meth:`ops.ActionEvent.set_results`
     """
-    on: CharmEvents
+    on: ClassVar[CharmEvents] = CharmEvents()
     """The events that this charm can respond to.
 
     Use this when calling :meth:`run` to specify the event to emit.
@@ -497,10 +568,10 @@ class Context(Generic[CharmType]):
         :arg charm_root: virtual charm filesystem root the charm will be executed with.
         """
 
-        if not any((meta, actions, config)):
+        if not (meta or actions or config):
             logger.debug("Autoloading charmspec...")
             try:
-                spec: _CharmSpec[CharmType] = _CharmSpec.autoload(charm_type)
+                spec: _CharmSpec[CharmType] = _autoload_spec(charm_type)
             except MetadataNotFoundError as e:
                 raise ContextSetupError(
                     f"Cannot setup scenario with `charm_type`={charm_type}. "
@@ -520,7 +591,7 @@ class Context(Generic[CharmType]):
         self.charm_spec = spec
         self.charm_root = charm_root
         self.juju_version = juju_version
-        if juju_version.split(".")[0] == "2":
+        if juju_version.startswith("2."):
             logger.warning(
                 "Juju 2.x is closed and unsupported. You may encounter inconsistencies.",
             )
@@ -528,7 +599,8 @@ class Context(Generic[CharmType]):
         self._app_name = app_name
         self._unit_id = unit_id
         self.app_trusted = app_trusted
-        self._tmp = tempfile.TemporaryDirectory()
+        # created on first use, as most tests never need a simulated filesystem.
+        self._tmp: tempfile.TemporaryDirectory[str] | None = None
 
         # config for what events to be captured in emitted_events.
         self.capture_deferred_events = capture_deferred_events
@@ -552,19 +624,35 @@ class Context(Generic[CharmType]):
         self.action_results: dict[str, Any] | None = None
         self._action_failure_message: str | None = None
 
-        self.on = CharmEvents()
+    @classmethod
+    def clear_autoload_cache(cls):
+        """Forget the charm metadata loaded from disk for autoloaded charm types.
+
+        A ``Context`` created without ``meta`` reads the charm's metadata files
+        the first time it is created for a given charm type, and reuses that
+        metadata for later Contexts. Call this if a test changes those files,
+        so that the next ``Context`` reads them again.
+        """
+        _load_spec.cache_clear()
 
     def _set_output_state(self, output_state: State):
         """Hook for Runtime to set the output state."""
         self._output_state = output_state
 
+    @property
+    def _tmp_dir(self) -> Path:
+        """The tempdir holding this context's simulated container and storage roots."""
+        if self._tmp is None:
+            self._tmp = tempfile.TemporaryDirectory()
+        return Path(self._tmp.name)
+
     def _get_container_root(self, container_name: str):
         """Get the path to a tempdir where this container's simulated root will live."""
-        return Path(self._tmp.name) / "containers" / container_name
+        return self._tmp_dir / "containers" / container_name
 
     def _get_storage_root(self, name: str, index: int) -> Path:
         """Get the path to a tempdir where this storage's simulated root will live."""
-        storage_root = Path(self._tmp.name) / "storages" / f"{name}-{index}"
+        storage_root = self._tmp_dir / "storages" / f"{name}-{index}"
         # in the case of _get_container_root, _MockPebbleClient will ensure the dir exists.
         storage_root.mkdir(parents=True, exist_ok=True)
         return storage_root
@@ -617,41 +705,7 @@ class Context(Generic[CharmType]):
         # Help people transition from Scenario 6:
         if isinstance(event, str):
             event = event.replace("-", "_")  # type: ignore
-            if event in (
-                "install",
-                "start",
-                "stop",
-                "remove",
-                "update_status",
-                "config_changed",
-                "upgrade_charm",
-                "pre_series_upgrade",
-                "post_series_upgrade",
-                "leader_elected",
-                "collect_app_status",
-                "collect_unit_status",
-            ):  # type: ignore
-                suggested = f"{event}()"
-            elif event in ("secret_changed", "secret_rotate"):  # type: ignore
-                suggested = f"{event}(my_secret)"
-            elif event in ("secret_expired", "secret_remove"):  # type: ignore
-                suggested = f"{event}(my_secret, revision=1)"
-            elif event in (
-                "relation_created",
-                "relation_joined",
-                "relation_changed",
-                "relation_departed",
-                "relation_broken",
-            ):  # type: ignore
-                suggested = f"{event}(my_relation)"
-            elif event in ("storage_attached", "storage_detaching"):  # type: ignore
-                suggested = f"{event}(my_storage)"
-            elif event == "pebble_ready":
-                suggested = f"{event}(my_container)"
-            elif event == "pebble_custom_notice":
-                suggested = f"{event}(my_container, my_notice)"
-            else:
-                suggested = "event()"
+            suggested = _EVENT_SUGGESTIONS.get(event, "event()")  # type: ignore
             raise TypeError(
                 f"call with an event from `ctx.on`, like `ctx.on.{suggested}`",
             )
@@ -680,8 +734,9 @@ class Context(Generic[CharmType]):
                 )
         return self._output_state
 
-    @contextmanager
     def _run(self, event: _Event, state: State):
+        # Runtime.exec() is already a context manager, so hand it back as is
+        # rather than wrapping it in another generator.
         runtime = Runtime(
             charm_spec=self.charm_spec,
             juju_version=self.juju_version,
@@ -689,9 +744,8 @@ class Context(Generic[CharmType]):
             app_name=self._app_name,
             unit_id=self._unit_id,
         )
-        with runtime.exec(
+        return runtime.exec(
             state=state,
             event=event,
             context=self,  # type: ignore
-        ) as ops:
-            yield ops
+        )
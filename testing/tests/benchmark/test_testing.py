@@ -158,15 +158,16 @@ def test_full_state(benchmark, benchmark_charm):
     # framework itself added (counting the number of events), so the
     # input and output state doesn't naively match. We strip that out and
     # compare it separately.
-    state_in_dict = dataclasses.asdict(state_in)
-    state_out_dict = dataclasses.asdict(state_out)
     # An owner_path of None means that it's owned by the framework.
-    assert state_in_dict["stored_states"] == {
-        ss for ss in state_out_dict["stored_states"] if ss.owner_path is not None
+    assert state_in.stored_states == {
+        ss for ss in state_out.stored_states if ss.owner_path is not None
     }
-    del state_in_dict["stored_states"]
-    del state_out_dict["stored_states"]
-    assert state_in_dict == state_out_dict
+    # Compare the remaining fields directly, rather than converting both
+    # states with dataclasses.asdict(), which deep-copies the whole State.
+    for field in dataclasses.fields(state_in):
+        if field.name == "stored_states":
+            continue
+        assert getattr(state_in, field.name) == getattr(state_out, field.name)
 
 
 def test_deferred_events(benchmark, benchmark_charm):
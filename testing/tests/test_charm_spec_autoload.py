@@ -115,6 +115,24 @@ def test_meta_autoload(tmp_path, legacy):
         ctx.run(ctx.on.start(), State())
 
 
+def test_meta_autoload_is_cached(tmp_path):
+    meta = {"type": "charm", "name": "foo", "summary": "foo", "description": "foo"}
+    with create_tempcharm(tmp_path, meta=meta) as charm:
+        ctx = Context(charm)
+        ctx.charm_spec.meta["name"] = "bar"
+        # Changes made through one Context don't leak into later ones.
+        assert Context(charm).charm_spec.meta["name"] == "foo"
+
+        (tmp_path / "charmcraft.yaml").write_text(
+            yaml.safe_dump({**meta, "name": "baz"})
+        )
+        # The metadata is not read from disk again for the same charm type...
+        assert Context(charm).charm_spec.meta["name"] == "foo"
+        # ...unless the cache is cleared.
+        Context.clear_autoload_cache()
+        assert Context(charm).charm_spec.meta["name"] == "baz"
+
+
 @pytest.mark.parametrize("legacy", (True, False))
 def test_no_meta_raises(tmp_path, legacy):
     with create_tempcharm(
@@ -1,3 +1,4 @@
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -68,3 +69,43 @@ def test_context_manager():
     with ctx(ctx.on.action("act"), state) as mgr:
         mgr.run()
         assert mgr.charm.meta.name == "foo"
+
+
+def test_tmp_dir_created_on_demand():
+    ctx = Context(MyCharm, meta={"name": "foo"})
+    ctx.run(ctx.on.start(), State())
+    assert ctx._tmp is None
+
+    root = ctx._get_storage_root("data", 0)
+    assert ctx._tmp is not None
+    assert root.is_dir()
+    assert root.parents[1] == Path(ctx._tmp.name)
+
+
+@pytest.mark.parametrize(
+    "event,suggested",
+    (
+        ("start", "start()"),
+        ("config-changed", "config_changed()"),
+        ("secret_changed", "secret_changed(my_secret)"),
+        ("secret_remove", "secret_remove(my_secret, revision=1)"),
+        ("relation_joined", "relation_joined(my_relation)"),
+        ("storage_detaching", "storage_detaching(my_storage)"),
+        ("pebble_custom_notice", "pebble_custom_notice(my_container, my_notice)"),
+        ("foo_bar", "event()"),
+    ),
+)
+def test_run_string_event_suggestion(event, suggested):
+    ctx = Context(MyCharm, meta={"name": "foo"})
+    with pytest.raises(TypeError) as exc_info:
+        ctx.run(event, State())
+    assert f"`ctx.on.{suggested}`" in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "juju_version,warns",
+    (("2.9.42", True), ("3.5", False), ("20.1", False)),
+)
+def test_juju_2_warning(caplog, juju_version, warns):
+    Context(MyCharm, meta={"name": "foo"}, juju_version=juju_version)
+    assert ("Juju 2.x is closed and unsupported" in caplog.text) == warns